@@ -16,14 +16,14 @@ stream = pa.open(format=pyaudio.paFloat32,
                  input=True,
                  frames_per_buffer=1024)
 
-# Record audio for the specified duration
-frames = []
-for i in range(int(sr / 1024 * duration)):
+# Record audio for the specified duration into a preallocated buffer
+num_chunks = int(sr / 1024 * duration)
+signal = np.empty(num_chunks * 1024, dtype=np.float32)
+for i in range(num_chunks):
     data = stream.read(1024)
-    frames.append(np.frombuffer(data, dtype=np.float32))
+    signal[i * 1024:(i + 1) * 1024] = np.frombuffer(data, dtype=np.float32)
 
 # Convert the recorded audio to a mono audio signal
-signal = np.concatenate(frames)
 signal = librosa.to_mono(signal)
 
 # Detect the piano notes in the audio signal
@@ -31,5 +31,6 @@ notes = librosa.onset.onset_detect(y=signal, sr=sr)
 
 # Print the detected piano notes
 print("Detected piano notes:")
+fft_freqs = librosa.fft_frequencies(n_fft=2048, sr=sr)
 for note in notes:
-    print(librosa.hz_to_note(librosa.fft_frequencies(n_fft=2048, sr=sr)[note]))
+    print(librosa.hz_to_note(fft_freqs[note]))
@@ -1,6 +1,7 @@
 import numpy as np
 import sounddevice as sd
 import librosa
+import scipy.signal
 
 # Source: https://www.seventhstring.com/resources/notefrequencies.html
 # 	C	    C#	    D	    Eb	    E	    F	    F#	    G	    G#	    A	    Bb	    B
@@ -125,25 +126,28 @@ NOTE_FREQS = {
     "B8": 7902,
 }
 
+NOTE_NAMES = list(NOTE_FREQS)
+NOTE_FREQ_VALUES = np.array(list(NOTE_FREQS.values()))
+
 FREQ_TRESHOLD = 1
 
 # Define a function to find the closest note to a given frequency
 def find_closest_note_freq(frequency):
-    distances = {n: abs(frequency - f) for n, f in NOTE_FREQS.items()}
-    closest_note, closest_freq = min(distances.items(), key=lambda x: x[1])
-    return closest_note, closest_freq
+    distances = np.abs(frequency - NOTE_FREQ_VALUES)
+    closest_idx = np.argmin(distances)
+    return NOTE_NAMES[closest_idx], distances[closest_idx]
 
 # Define the audio processing callback function
 def audio_callback(indata, frames, time, status):
     if status:
         print(status, flush=True)
     # Convert audio data to frequency domain using FFT
-    magnitude = np.abs(librosa.stft(indata[:, 0]))
+    magnitude = np.abs(librosa.stft(indata[:, 0], window=hann_window))
     # Find the frequency with maximum magnitude
     max_magnitude_idx = np.argmax(magnitude)
     # if magnitude[max_magnitude_idx] < 9:
     #     return
-    frequency = librosa.fft_frequencies(sr=sample_rate, n_fft=frames)[max_magnitude_idx]
+    frequency = fft_freqs[max_magnitude_idx]
 
     if frequency < FREQ_TRESHOLD:
         return
@@ -153,10 +157,15 @@ def audio_callback(indata, frames, time, status):
     print(f"Detected note: {closest_note}, frequency: {closest_freq:.2f} Hz, Magnitude:{magnitude[max_magnitude_idx]}", flush=True)
 
 
-# Set the audio sampling rate
+# Set the audio sampling rate and block size
 sample_rate = 44100
+block_size = 2048
+# The block size is fixed, so the FFT bin frequencies only need computing once
+fft_freqs = librosa.fft_frequencies(sr=sample_rate, n_fft=block_size)
+# Likewise build the STFT's Hann window once instead of on every block
+hann_window = scipy.signal.get_window('hann', block_size, fftbins=True)
 
 # Start the audio stream and run the audio processing callback function
-with sd.InputStream(callback=audio_callback, blocksize=2048, samplerate=sample_rate):
+with sd.InputStream(callback=audio_callback, blocksize=block_size, samplerate=sample_rate):
     while True:
-        pass
+        sd.sleep(1000)
@@ -119,11 +119,13 @@ class MusicGenerator:
         self.sr = sr
         self.duration = duration
         self.p = pyaudio.PyAudio()
+        # Every note has the same length, so build the phase ramp once
+        samples = int(self.sr * self.duration)
+        t = np.linspace(0, self.duration, samples, False)
+        self.phase = t * 2 * np.pi
 
     def generate_sinewave(self, frequency):
-        samples = self.sr * self.duration
-        t = np.linspace(0, self.duration, samples, False)
-        note = np.sin(frequency * t * 2 * np.pi)
+        note = np.sin(frequency * self.phase)
         return note.astype(np.float32)
 
     def play_sound(self, frequency):
@@ -137,12 +139,8 @@ class MusicGenerator:
         stream.close()
 
     def play_sequence(self, notes, durations):
-        samples = []
-
         for n, d in zip(notes, durations):
-            frequency = 440 * 2 ** ((NOTE_FREQS[n] - 69) / 12)
-
-            self.play_sound(NOTE_FREQS[n]) # plays an A4 note
+            self.play_sound(NOTE_FREQS[n])
 
     def play_song(self, song_path):
         y, sr = librosa.load(song_path, duration=self.duration)
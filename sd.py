@@ -124,13 +124,17 @@ NOTE_FREQS = {
     "B8": 7902,
 }
 
+NOTE_NAMES = list(NOTE_FREQS)
+NOTE_FREQ_VALUES = np.array(list(NOTE_FREQS.values()))
+
 FREQ_TRESHOLD = 1
+MAGNITUDE_THRESHOLD = 9
 
 # Define a function to find the closest note to a given frequency
 def find_closest_note_freq(frequency):
-    distances = {n: abs(frequency - f) for n, f in NOTE_FREQS.items()}
-    closest_note, closest_freq = min(distances.items(), key=lambda x: x[1])
-    return closest_note, closest_freq
+    distances = np.abs(frequency - NOTE_FREQ_VALUES)
+    closest_idx = np.argmin(distances)
+    return NOTE_NAMES[closest_idx], distances[closest_idx]
 
 
 def get_magnitude_frequency(indata, frames):
@@ -147,9 +151,14 @@ def audio_callback(indata, frames, sTime, status):
     if status:
         print(status, flush=True)
 
+    # No FFT bin can exceed the sum of absolute sample values, so a block
+    # below the threshold here is silent and the FFT can be skipped
+    if np.abs(indata[:, 0]).sum() < MAGNITUDE_THRESHOLD:
+        return
+
     magnitude, frequency = get_magnitude_frequency(indata, frames)
 
-    if magnitude < 9 or frequency < FREQ_TRESHOLD:
+    if magnitude < MAGNITUDE_THRESHOLD or frequency < FREQ_TRESHOLD:
         return
 
     # Find the closest note to the detected frequency
@@ -167,4 +176,4 @@ print(sample_rate)
 # Start the audio stream and run the audio processing callback function
 with sd.InputStream(callback=audio_callback, blocksize=2048, samplerate=sample_rate):
     while True:
-        pass
+        sd.sleep(1000)
@@ -24,10 +24,13 @@ class MusicPlayer:
         for note in notes:
             frequency = 440 * 2 ** ((note[0] - 69) / 12)
             duration = note[1] * self.note_duration
-            samples += self._generate_samples(frequency, duration)
+            samples.append(self._generate_samples(frequency, duration))
 
-        # Convert the list of samples to a numpy array
-        samples = np.array(samples)
+        # Join the per-note float32 arrays into a single buffer
+        if samples:
+            samples = np.concatenate(samples)
+        else:
+            samples = np.zeros(0, dtype=np.float32)
 
         # Scale the samples to the desired volume
         samples *= self.volume
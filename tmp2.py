@@ -8,6 +8,11 @@ FORMAT = pyaudio.paFloat32
 CHANNELS = 1
 RATE = 22050  # Reduced sample rate
 CHUNK = 4096 # increased buffer size
+# Frequencies of the FFT bins, fixed for the chunk size
+FREQS = np.fft.fftfreq(CHUNK) * RATE
+# The note to detect is fixed, so its FFT bin is too
+NOTE_TO_DETECT = music21.note.Note('C#5')
+NOTE_IDX = (np.abs(FREQS - NOTE_TO_DETECT.pitch.frequency)).argmin()
 
 # Create a new PyAudio object
 p = pyaudio.PyAudio()
@@ -33,26 +38,18 @@ def detect_note(data):
     # Process the audio data and detect the music note
     # ...
     # Convert the data to a numpy array
-    note_to_detect = music21.note.Note('C#5')
-
     numpy_data = np.frombuffer(data, dtype=np.float32)
 
     # Apply a Fast Fourier Transform (FFT) to the data
     fft_data = np.fft.fft(numpy_data)
 
-    # Calculate the frequencies corresponding to the FFT data
-    freqs = np.fft.fftfreq(len(fft_data)) * RATE
-
-    # Find the index of the frequency closest to the note we want to detect
-    idx = (np.abs(freqs - note_to_detect.pitch.frequency)).argmin()
-
-    # Get the magnitude of the FFT data at that frequency
-    magnitude = np.abs(fft_data[idx])
+    # Get the magnitude of the FFT data at the note's frequency
+    magnitude = np.abs(fft_data[NOTE_IDX])
 
     # Check if the magnitude is above a certain threshold
     if magnitude > 1e7:
         # Add the detected note to the list
-        detected_notes.append(note_to_detect)
+        detected_notes.append(NOTE_TO_DETECT)
 
 # Create a new plotly figure
 fig = go.Figure()